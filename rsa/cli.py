@@ -3,6 +3,7 @@
 These scripts are called by the executables defined in setup.py.
 """
 import abc
+import os
 import sys
 import typing
 import optparse
@@ -40,27 +41,26 @@ def keygen() -> None:
     (pub_key, priv_key) = rsa.newkeys(cli.nbits)
     
     # Save private key
+    data = priv_key.save_pkcs1(format=cli.form)
     if cli.out:
-        data = priv_key.save_pkcs1(format=cli.form)
         with open(cli.out, 'wb') as outfile:
             outfile.write(data)
         print('Private key saved to %s' % cli.out, file=sys.stderr)
     else:
-        data = priv_key.save_pkcs1(format=cli.form)
         print(data.decode('ascii'))
-    
+
     # Save public key
+    if not (cli.pubout or cli.out):
+        return
+
+    data = pub_key.save_pkcs1(format=cli.form)
     if cli.pubout:
-        data = pub_key.save_pkcs1(format=cli.form)
-        with open(cli.pubout, 'wb') as outfile:
-            outfile.write(data)
-        print('Public key saved to %s' % cli.pubout, file=sys.stderr)
-    elif cli.out:
-        data = pub_key.save_pkcs1(format=cli.form)
+        public_fn = cli.pubout
+    else:
         public_fn = '%s_pub.pem' % os.path.splitext(cli.out)[0]
-        with open(public_fn, 'wb') as outfile:
-            outfile.write(data)
-        print('Public key saved to %s' % public_fn, file=sys.stderr)
+    with open(public_fn, 'wb') as outfile:
+        outfile.write(data)
+    print('Public key saved to %s' % public_fn, file=sys.stderr)
 
 class CryptoOperation(metaclass=abc.ABCMeta):
     """CLI callable that operates with input, output, and a key."""
@@ -76,10 +76,12 @@ class CryptoOperation(metaclass=abc.ABCMeta):
     has_output = True
     key_class = rsa.PublicKey
 
-    def __init__(self) -> None:
-        self.usage = self.usage % self.__class__.__dict__
-        self.input_help = self.input_help % self.__class__.__dict__
-        self.output_help = self.output_help % self.__class__.__dict__
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        """Fills in the help texts once per subclass, rather than per instance."""
+        super().__init_subclass__(**kwargs)
+        cls.usage = cls.usage % cls.__dict__
+        cls.input_help = cls.input_help % cls.__dict__
+        cls.output_help = cls.output_help % cls.__dict__
 
     @abc.abstractmethod
     def perform_operation(self, indata: bytes, key: rsa.key.AbstractKey, cli_args: Indexable) -> typing.Any:
@@ -135,6 +137,9 @@ class CryptoOperation(metaclass=abc.ABCMeta):
 
     def read_infile(self, inname: str) -> bytes:
         """Read the input file"""
+        # A plain read() is already the cheapest option here: for regular
+        # files (and stdin redirected from one) it allocates the result once,
+        # sized with fstat(), and the operations need immutable bytes anyway.
         if inname:
             with open(inname, 'rb') as infile:
                 return infile.read()
@@ -144,8 +149,16 @@ class CryptoOperation(metaclass=abc.ABCMeta):
     def write_outfile(self, outdata: bytes, outname: str) -> None:
         """Write the output file"""
         if outname:
-            with open(outname, 'wb') as outfile:
-                outfile.write(outdata)
+            # Write straight to the file descriptor, bypassing the buffered
+            # IO layer. The permission bits are the same as with open().
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(outname, flags, 0o666)
+            try:
+                view = memoryview(outdata)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
         else:
             sys.stdout.buffer.write(outdata)
 
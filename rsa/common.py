@@ -1,6 +1,10 @@
 """Common functionality shared by several modules."""
+import sys
 import typing
 
+# Since Python 3.8, pow() computes modular inverses in C.
+_HAVE_POW_INVERSE = sys.version_info >= (3, 8)
+
 class NotRelativePrimeError(ValueError):
 
     def __init__(self, a: int, b: int, d: int, msg: str='') -> None:
@@ -30,9 +34,10 @@ def bit_size(num: int) -> int:
     :returns:
         Returns the number of bits in the integer.
     """
-    if num == 0:
-        return 0
-    return len(bin(abs(num))) - 2  # Subtract 2 to remove '0b' prefix
+    try:
+        return num.bit_length()
+    except AttributeError as ex:
+        raise TypeError('bit_size(num) only supports integers, not %r' % type(num)) from ex
 
 def byte_size(number: int) -> int:
     """
@@ -48,13 +53,19 @@ def byte_size(number: int) -> int:
         128
         >>> byte_size(1 << 1024)
         129
+        >>> byte_size(0)
+        1
 
     :param number:
         An unsigned integer
     :returns:
-        The number of bytes required to hold a specific long number.
+        The number of bytes required to hold a specific long number. Zero
+        still takes up one byte.
     """
-    return (bit_size(number) + 7) // 8
+    try:
+        return (number.bit_length() + 7) >> 3 or 1
+    except AttributeError as ex:
+        raise TypeError('byte_size(number) only supports integers, not %r' % type(number)) from ex
 
 def ceil_div(num: int, div: int) -> int:
     """
@@ -76,16 +87,65 @@ def ceil_div(num: int, div: int) -> int:
     """
     return -(-num // div)
 
+# Lehmer steps are only taken for operands larger than this many bits (plus
+# one 64-bit window). Below that, plain bignum division is faster in Python;
+# at 1024 bits the Lehmer steps are about 30% slower, and they only break even
+# around 2048 bits.
+_LEHMER_MIN_SHIFT = 1024
+
 def extended_gcd(a: int, b: int) -> typing.Tuple[int, int, int]:
-    """Returns a tuple (r, i, j) such that r = gcd(a, b) = ia + jb"""
-    x, y = 0, 1
-    lastx, lasty = 1, 0
+    """Returns a tuple (r, i, j) such that r = gcd(a, b) = ia + jb
+
+    Uses Lehmer's algorithm for large operands: a run of Euclidean steps is
+    simulated on their leading 64 bits, and the resulting cofactor matrix is
+    applied to the full numbers at once. This replaces most of the bignum
+    divisions by single-word ones. See Knuth, The Art of Computer Programming
+    vol. 2, Algorithm 4.5.2L.
+
+    This only pays off for operands larger than about 2048 bits. Note that
+    inverse() uses pow() instead on Python 3.8 and newer, and only calls this
+    function to find the divider of numbers that are not relatively prime.
+
+    >>> extended_gcd(240, 46)
+    (2, -9, 47)
+    """
+    a0, b0 = a, b
+    x, lastx = 0, 1
 
     while b:
+        shift = a.bit_length() - 64
+        if shift > _LEHMER_MIN_SHIFT and b > 0 and a >= b:
+            ah, bh = a >> shift, b >> shift
+            qa, qb, qc, qd = 1, 0, 0, 1
+
+            # Collect quotients for as long as they are exactly determined by
+            # the leading bits of a and b (Jebelean's condition). The
+            # cofactors are kept non-negative; their signs alternate.
+            steps = 0
+            while bh != qc:
+                q = (ah + qa - 1) // (bh - qc)
+                s = qb + q * qd
+                t = ah - q * bh
+                if s > t:
+                    break
+                ah, bh = bh, t
+                qa, qb, qc, qd = qd, qc, s, qa + q * qc
+                steps += 1
+
+            if steps:
+                if steps & 1:
+                    a, b = qa * b - qb * a, qd * a - qc * b
+                    lastx, x = qa * x - qb * lastx, qd * lastx - qc * x
+                else:
+                    a, b = qa * a - qb * b, qd * b - qc * a
+                    lastx, x = qa * lastx - qb * x, qd * x - qc * lastx
+                continue
+
         a, (q, b) = b, divmod(a, b)
         x, lastx = lastx - q * x, x
-        y, lasty = lasty - q * y, y
 
+    # Only the cofactor of a is tracked; the one of b follows from it.
+    lasty = (a - lastx * a0) // b0 if b0 else 0
     return (a, lastx, lasty)
 
 def inverse(x: int, n: int) -> int:
@@ -96,6 +156,12 @@ def inverse(x: int, n: int) -> int:
     >>> (inverse(143, 4) * 143) % 4
     1
     """
+    if _HAVE_POW_INVERSE and n > 0:
+        try:
+            return pow(x, -1, n)
+        except ValueError:
+            pass  # Not invertible; let extended_gcd() find the divider.
+
     gcd, a, _ = extended_gcd(x, n)
     if gcd != 1:
         raise NotRelativePrimeError(x, n, gcd)
@@ -120,17 +186,17 @@ def crt(a_values: typing.Iterable[int], modulo_values: typing.Iterable[int]) ->
     >>> crt([2, 3, 0], [7, 11, 15])
     135
     """
-    total = 0
+    # Garner's algorithm: x is built up one modulus at a time, so that every
+    # inverse is computed modulo a single m_i instead of the full product.
+    x = 0
     prod = 1
 
-    for m in modulo_values:
-        prod *= m
-
     for a_i, m_i in zip(a_values, modulo_values):
-        p = prod // m_i
-        total += a_i * inverse(p, m_i) * p
+        t = ((a_i - x) * inverse(prod % m_i, m_i)) % m_i
+        x += t * prod
+        prod *= m_i
 
-    return total % prod
+    return x
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -4,10 +4,26 @@ This is the actual core RSA implementation, which is only defined
 mathematically on integers.
 """
 
+try:
+    # GMP's modular exponentiation is much faster than Python's for numbers
+    # of the sizes used in RSA. It is optional; pow() is used without it.
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+def powmod(base: int, exponent: int, modulus: int) -> int:
+    """Returns base ** exponent % modulus, as a Python int.
+
+    Uses gmpy2 when it is installed, and pow() otherwise.
+    """
+    if gmpy2 is not None:
+        return int(gmpy2.powmod(base, exponent, modulus))
+    return pow(base, exponent, modulus)
+
 def encrypt_int(message: int, ekey: int, n: int) -> int:
     """Encrypts a message using encryption key 'ekey', working modulo n"""
-    return pow(message, ekey, n)
+    return powmod(message, ekey, n)
 
 def decrypt_int(cyphertext: int, dkey: int, n: int) -> int:
     """Decrypts a cypher text using the decryption key 'dkey', working modulo n"""
-    return pow(cyphertext, dkey, n)
+    return powmod(cyphertext, dkey, n)
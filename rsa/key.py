@@ -25,6 +25,10 @@ import rsa.common
 import rsa.randnum
 import rsa.core
 DEFAULT_EXPONENT = 65537
+
+# Size of the random multiple of p - 1 and q - 1 that is added to the private
+# exponents on every private key operation.
+_EXPONENT_BLINDING_BITS = 64
 T = typing.TypeVar('T', bound='AbstractKey')
 
 class AbstractKey:
@@ -137,7 +141,9 @@ class AbstractKey:
 
         See https://en.wikipedia.org/wiki/Blinding_%28cryptography%29
         """
-        pass
+        blindfac, blindfac_inverse = self._update_blinding_factor()
+        blinded = (message * rsa.core.powmod(blindfac, self.e, self.n)) % self.n
+        return (blinded, blindfac_inverse)
 
     def unblind(self, blinded: int, blindfac_inverse: int) -> int:
         """Performs blinding on the message using random number 'blindfac_inverse'.
@@ -150,7 +156,14 @@ class AbstractKey:
 
         See https://en.wikipedia.org/wiki/Blinding_%28cryptography%29
         """
-        pass
+        return (blindfac_inverse * blinded) % self.n
+
+    def _initial_blinding_factor(self) -> int:
+        for _ in range(1000):
+            blind_r = rsa.randnum.randint(self.n - 1)
+            if rsa.prime.are_relatively_prime(self.n, blind_r):
+                return blind_r
+        raise RuntimeError('unable to find blinding factor')
 
     def _update_blinding_factor(self) -> typing.Tuple[int, int]:
         """Update blinding factors.
@@ -163,7 +176,17 @@ class AbstractKey:
 
         :return: the new blinding factor and its inverse.
         """
-        pass
+        with self.mutex:
+            if self.blindfac < 0:
+                # Compute initial blinding factor, which is rather slow to do.
+                self.blindfac = self._initial_blinding_factor()
+                self.blindfac_inverse = rsa.common.inverse(self.blindfac, self.n)
+            else:
+                # Reuse previous blinding factor.
+                self.blindfac = rsa.core.powmod(self.blindfac, 2, self.n)
+                self.blindfac_inverse = rsa.core.powmod(self.blindfac_inverse, 2, self.n)
+
+            return (self.blindfac, self.blindfac_inverse)
 
 class PublicKey(AbstractKey):
     """Represents a public RSA key.
@@ -389,7 +412,10 @@ class PrivateKey(AbstractKey):
         :returns: the decrypted message
         :rtype: int
         """
-        pass
+        # Blinding and un-blinding should be using the same factor
+        blinded, blindfac_inverse = self.blind(encrypted)
+        decrypted = self._crt_exponentiate(blinded)
+        return self.unblind(decrypted, blindfac_inverse)
 
     def blinded_encrypt(self, message: int) -> int:
         """Encrypts the message using blinding to prevent side-channel attacks.
@@ -400,7 +426,30 @@ class PrivateKey(AbstractKey):
         :returns: the encrypted message
         :rtype: int
         """
-        pass
+        blinded, blindfac_inverse = self.blind(message)
+        encrypted = self._crt_exponentiate(blinded)
+        return self.unblind(encrypted, blindfac_inverse)
+
+    def _crt_exponentiate(self, value: int) -> int:
+        """Returns value ** d % n, using a freshly blinded private exponent.
+
+        Instead of using the core functionality, use the Chinese Remainder
+        Theorem and be 2-4x faster. This is the same as:
+        rsa.core.decrypt_int(value, self.d, self.n)
+
+        The exponents are blinded as well: exp1 + k * (p - 1) gives the same
+        result modulo p for any k, so a random 64-bit k is added on every
+        call. This way the exponent differs between calls, and timing or
+        power measurements over many calls can't be combined to recover it.
+        The extra 64 bits make the exponentiations only a few percent slower.
+        """
+        exp1 = self.exp1 + rsa.randnum.read_random_int(_EXPONENT_BLINDING_BITS) * (self.p - 1)
+        exp2 = self.exp2 + rsa.randnum.read_random_int(_EXPONENT_BLINDING_BITS) * (self.q - 1)
+
+        s1 = rsa.core.decrypt_int(value, exp1, self.p)
+        s2 = rsa.core.decrypt_int(value, exp2, self.q)
+        h = ((s1 - s2) * self.coef) % self.p
+        return s2 + self.q * h
 
     @classmethod
     def _load_pkcs1_der(cls, keyfile: bytes) -> 'PrivateKey':
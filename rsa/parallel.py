@@ -7,15 +7,56 @@ Introduced in Python-RSA 3.1.
     Requires Python 2.6 or newer.
 
 """
+import collections
+import functools
 import multiprocessing as mp
-from multiprocessing.connection import Connection
+import os
+import typing
+from multiprocessing.connection import Connection, wait
 import rsa.prime
-import rsa.randnum
+
+# Primes that other workers had already found when getprime() got its result,
+# per number of bits. They are handed out by subsequent calls instead of being
+# thrown away, and each of them only once.
+_MAX_SPARE_PRIMES = 16
+_spare_primes: typing.DefaultDict[int, typing.Deque[int]] = collections.defaultdict(
+    functools.partial(collections.deque, maxlen=_MAX_SPARE_PRIMES)
+)
+
+# The process that owns the spare primes. After a fork, handing out the same
+# spare primes in two processes would produce keys sharing a factor.
+_owner_pid = os.getpid()
+
+def _check_owner() -> None:
+    """Forgets the spare primes inherited through a fork."""
+    global _owner_pid
+
+    if _owner_pid == os.getpid():
+        return
+    _spare_primes.clear()
+    _owner_pid = os.getpid()
+
+def _worker(nbits: int, pipe: Connection) -> None:
+    """Worker process, sends prime numbers of exactly 'nbits' bits.
+
+    The top two bits of each prime are set, so that the product of two such
+    primes always has exactly 2 * nbits bits. Each worker runs the sieved
+    search of :py:func:`rsa.prime.getprime`.
+
+    Starting points come from os.urandom(), which keeps no state in the Python
+    process, so forked workers never search the same sequence of numbers.
+    """
+    top_bits = 0b11 << (nbits - 2)
+    while True:
+        pipe.send(rsa.prime.getprime(nbits, top_bits=top_bits))
 
 def getprime(nbits: int, poolsize: int) -> int:
     """Returns a prime number that can be stored in 'nbits' bits.
 
-    Works in multiple threads at the same time.
+    Works in multiple processes at the same time. They are terminated as soon
+    as one of them has found a prime. Primes that the other processes have
+    found by then are kept, and returned by the next calls with the same
+    'nbits' without starting any process.
 
     >>> p = getprime(128, 3)
     >>> rsa.prime.is_prime(p-1)
@@ -30,24 +71,40 @@ def getprime(nbits: int, poolsize: int) -> int:
     True
 
     """
-    def worker(nbits: int, pipe: Connection) -> None:
-        while True:
-            prime = rsa.prime.getprime(nbits)
-            pipe.send(prime)
+    _check_owner()
+    spare_primes = _spare_primes[nbits]
+    if spare_primes:
+        return spare_primes.popleft()
+
+    # Forking avoids re-importing the rsa package in every worker.
+    context = mp.get_context('fork') if os.name == 'posix' else mp.get_context()
 
     pipes = []
     processes = []
-    for _ in range(poolsize):
-        recv_end, send_end = mp.Pipe(False)
-        p = mp.Process(target=worker, args=(nbits, send_end))
-        pipes.append(recv_end)
-        processes.append(p)
-        p.start()
-
-    result = pipes[0].recv()
-    
-    for p in processes:
-        p.terminate()
+    try:
+        for _ in range(poolsize):
+            recv_end, send_end = context.Pipe(False)
+            p = context.Process(target=_worker, args=(nbits, send_end), daemon=True)
+            p.start()
+            send_end.close()
+            pipes.append(recv_end)
+            processes.append(p)
+
+        # Take the prime of whichever worker finds one first.
+        ready = wait(pipes)
+        result: int = next(pipe for pipe in pipes if pipe in ready).recv()
+
+        # Collect the primes that are already waiting in the pipes.
+        for pipe in pipes:
+            while len(spare_primes) < _MAX_SPARE_PRIMES and pipe.poll():
+                spare_primes.append(pipe.recv())
+    finally:
+        for p in processes:
+            p.terminate()
+        for p in processes:
+            p.join()
+        for pipe in pipes:
+            pipe.close()
 
     return result
 __all__ = ['getprime']
@@ -1,5 +1,6 @@
 """Functions that load and write PEM-encoded files."""
-import base64
+import binascii
+import functools
 import typing
 FlexiText = typing.Union[str, bytes]
 
@@ -9,20 +10,44 @@ def _markers(pem_marker: FlexiText) -> typing.Tuple[bytes, bytes]:
     """
     if isinstance(pem_marker, str):
         pem_marker = pem_marker.encode('ascii')
+    return _bytes_markers(pem_marker)
+
+# Only a handful of different markers are used in practice, so the derived
+# markers are cached. The cache is keyed on bytes, so
+# that str and bytes markers share entries.
+@functools.lru_cache(maxsize=8)
+def _bytes_markers(pem_marker: bytes) -> typing.Tuple[bytes, bytes]:
+    """Returns the start and end PEM markers for a bytes marker."""
     return (b'-----BEGIN ' + pem_marker + b'-----',
             b'-----END ' + pem_marker + b'-----')
 
-def _pem_lines(contents: bytes, pem_start: bytes, pem_end: bytes) -> typing.Iterator[bytes]:
-    """Generator over PEM lines between pem_start and pem_end."""
-    in_pem_part = False
-    for line in contents.split(b'\n'):
-        line = line.strip()
-        if line == pem_start:
-            in_pem_part = True
-        elif in_pem_part:
-            if line == pem_end:
-                break
-            yield line
+def _find_marker_line(contents: bytes, marker: bytes, start: int) -> typing.Tuple[int, int]:
+    """Finds the first line from 'start' on that holds just the marker.
+
+    Whitespace around the marker is allowed, such as the carriage return of a
+    CRLF line ending.
+
+    :return: the offsets of the start and the end of that line, or (-1, -1)
+        when there is no such line.
+    """
+    index = contents.find(marker, start)
+    while index != -1:
+        marker_end = index + len(marker)
+        # The common case: the marker is a line of its own already.
+        if (index == start or contents[index - 1] == 0x0A) and contents.startswith(b'\n', marker_end):
+            return (index, marker_end)
+
+        line_start = contents.rfind(b'\n', start, index) + 1 or start
+        line_end = contents.find(b'\n', marker_end)
+        if line_end == -1:
+            line_end = len(contents)
+
+        if ((line_start == index or contents[line_start:index].isspace()) and
+                (marker_end == line_end or contents[marker_end:line_end].isspace())):
+            return (line_start, line_end)
+        index = contents.find(marker, index + 1)
+
+    return (-1, -1)
 
 def load_pem(contents: FlexiText, pem_marker: FlexiText) -> bytes:
     """Loads a PEM file.
@@ -40,18 +65,34 @@ def load_pem(contents: FlexiText, pem_marker: FlexiText) -> bytes:
     """
     if isinstance(contents, str):
         contents = contents.encode('ascii')
-    
+
     (pem_start, pem_end) = _markers(pem_marker)
-    pem_lines = [line for line in _pem_lines(contents, pem_start, pem_end)]
-    
-    if not pem_lines:
-        raise ValueError('No PEM start marker "%s" found' % pem_start)
-    
+
+    (_, body_start) = _find_marker_line(contents, pem_start, 0)
+    if body_start == -1:
+        raise ValueError('No PEM start marker "%r" found' % pem_start)
+
+    (body_end, _) = _find_marker_line(contents, pem_end, body_start)
+    if body_end == -1:
+        raise ValueError('No PEM end marker "%r" found' % pem_end)
+
+    # Header lines such as "Proc-Type: 4,ENCRYPTED" are not part of the
+    # base64-encoded data. Key files rarely have them, so only look for them
+    # when there is a colon at all. a2b_base64 skips whitespace and any other
+    # non-alphabet bytes by itself.
+    pem_body = contents[body_start:body_end]
+    if pem_body.find(b':') != -1:
+        pem_body = b'\n'.join(line for line in pem_body.split(b'\n') if b':' not in line)
+
     try:
-        return base64.b64decode(b''.join(pem_lines))
-    except Exception as e:
+        decoded = binascii.a2b_base64(pem_body)
+    except binascii.Error as e:
         raise ValueError('Invalid PEM data') from e
 
+    if not decoded:
+        raise ValueError('No PEM data found between the markers')
+    return decoded
+
 def save_pem(contents: bytes, pem_marker: FlexiText) -> bytes:
     """Saves a PEM file.
 
@@ -64,12 +105,8 @@ def save_pem(contents: bytes, pem_marker: FlexiText) -> bytes:
 
     """
     (pem_start, pem_end) = _markers(pem_marker)
-    b64 = base64.b64encode(contents).replace(b'\n', b'')
-    pem_lines = [pem_start]
-    
-    for block_start in range(0, len(b64), 64):
-        block = b64[block_start:block_start + 64]
-        pem_lines.append(block)
-    
+    b64 = binascii.b2a_base64(contents, newline=False)
+    pem_lines = [b64[block_start:block_start + 64] for block_start in range(0, len(b64), 64)]
+    pem_lines.insert(0, pem_start)
     pem_lines.append(pem_end)
     return b'\n'.join(pem_lines) + b'\n'
@@ -16,7 +16,7 @@ import os
 import sys
 import typing
 from hmac import compare_digest
-from . import common, transform, core, key
+from . import common, core, key
 if typing.TYPE_CHECKING:
     HashType = hashlib._Hash
 else:
@@ -28,6 +28,10 @@ if sys.version_info >= (3, 6):
     HASH_ASN1.update({'SHA3-256': b'010\r\x06\t`\x86H\x01e\x03\x04\x02\x08\x05\x00\x04 ', 'SHA3-384': b'0A0\r\x06\t`\x86H\x01e\x03\x04\x02\t\x05\x00\x040', 'SHA3-512': b'0Q0\r\x06\t`\x86H\x01e\x03\x04\x02\n\x05\x00\x04@'})
     HASH_METHODS.update({'SHA3-256': hashlib.sha3_256, 'SHA3-384': hashlib.sha3_384, 'SHA3-512': hashlib.sha3_512})
 
+# Reverse lookup of HASH_ASN1, used to find the hash method of a signature.
+_ASN1_HASH_NAMES = {asn1code: hashname for (hashname, asn1code) in HASH_ASN1.items()}
+_ASN1_CODE_LENGTHS = sorted({len(asn1code) for asn1code in HASH_ASN1.values()})
+
 class CryptoError(Exception):
     """Base class for all exceptions in this module."""
 
@@ -60,12 +64,12 @@ def _pad_for_encryption(message: bytes, target_length: int) -> bytes:
     
     padding_length = target_length - msglength - 3
     
-    padding = b''
+    # Get random padding without zero bytes. About one in 256 random bytes is
+    # zero, so drawing a bit more than needed nearly always suffices at once.
+    padding = os.urandom(padding_length + padding_length // 64 + 8).replace(b'\x00', b'')
     while len(padding) < padding_length:
-        needed_bytes = padding_length - len(padding)
-        new_padding = os.urandom(needed_bytes + 5)
-        new_padding = new_padding.replace(b'\x00', b'')
-        padding = padding + new_padding[:needed_bytes]
+        padding += os.urandom(padding_length - len(padding) + 8).replace(b'\x00', b'')
+    padding = padding[:padding_length]
     
     return b''.join([b'\x00\x02',
                      padding,
@@ -104,6 +108,33 @@ def _pad_for_signing(message: bytes, target_length: int) -> bytes:
                      b'\x00',
                      message])
 
+def _pad_for_signing_int(message: bytes, target_length: int) -> int:
+    """Pads the message for signing, returning the padded message as integer.
+
+    This is equivalent to ``int.from_bytes(_pad_for_signing(...), 'big')``,
+    but builds the integer arithmetically from the known layout instead of
+    allocating the padded block and parsing it again.
+
+    >>> block = _pad_for_signing(b'hello', 16)
+    >>> _pad_for_signing_int(b'hello', 16) == int.from_bytes(block, 'big')
+    True
+
+    """
+    max_msglength = target_length - 11
+    msglength = len(message)
+    
+    if msglength > max_msglength:
+        raise OverflowError('%i bytes needed for message, but there is only'
+                            ' space for %i' % (msglength, max_msglength))
+    
+    padding_length = target_length - msglength - 3
+    
+    # The 01 marker followed by the FF padding bytes is
+    # 2 ** (8 * padding_length + 1) - 1, e.g. 0x01FF for one padding byte;
+    # it sits above the 00 separator and the message.
+    marker_and_padding = (2 << (8 * padding_length)) - 1
+    return (marker_and_padding << (8 * (msglength + 1))) | int.from_bytes(message, 'big')
+
 def encrypt(message: bytes, pub_key: key.PublicKey) -> bytes:
     """Encrypts the given message using PKCS#1 v1.5
 
@@ -127,9 +158,9 @@ def encrypt(message: bytes, pub_key: key.PublicKey) -> bytes:
     """
     keylength = common.byte_size(pub_key.n)
     padded = _pad_for_encryption(message, keylength)
-    payload = transform.bytes2int(padded)
+    payload = int.from_bytes(padded, 'big')
     encrypted = core.encrypt_int(payload, pub_key.e, pub_key.n)
-    block = transform.int2bytes(encrypted, keylength)
+    block = encrypted.to_bytes(keylength, 'big')
     return block
 
 def decrypt(crypto: bytes, priv_key: key.PrivateKey) -> bytes:
@@ -183,21 +214,32 @@ def decrypt(crypto: bytes, priv_key: key.PrivateKey) -> bytes:
 
     """
     blocksize = common.byte_size(priv_key.n)
-    encrypted = transform.bytes2int(crypto)
-    decrypted = priv_key.blinded_decrypt(encrypted)
-    cleartext = transform.int2bytes(decrypted, blocksize)
 
-    # If we can't find the cleartext marker, decryption failed.
-    if cleartext[0:2] != b'\x00\x02':
+    # Leading zeroes in the crypto are not reflected in the encrypted value,
+    # as they don't influence the value of an integer. This operates on public
+    # information, so doesn't need to be constant-time.
+    if len(crypto) > blocksize:
         raise DecryptionError('Decryption failed')
 
-    # Find the 00 separator between the padding and the message
-    try:
-        sep_idx = cleartext.index(b'\x00', 2)
-    except ValueError:
+    encrypted = int.from_bytes(crypto, 'big')
+    decrypted = priv_key.blinded_decrypt(encrypted)
+    cleartext = decrypted.to_bytes(blocksize, 'big')
+
+    # The checks below all run, and are combined without branching, so that
+    # the time taken doesn't reveal which one failed (Bleichenbacher).
+    cleartext_marker_bad = not compare_digest(cleartext[:2], b'\x00\x02')
+
+    # Find the 00 separator between the padding and the message. The padding
+    # must be at least 8 bytes long (RFC 8017, section 7.2.2, step 3), so the
+    # separator must be at index 10 or later. find() returns -1 if it is
+    # missing, which fails this check too.
+    sep_idx = cleartext.find(b'\x00', 2)
+    sep_idx_bad = sep_idx < 10
+
+    if cleartext_marker_bad | sep_idx_bad:
         raise DecryptionError('Decryption failed')
 
-    return cleartext[sep_idx+1:]
+    return cleartext[sep_idx + 1:]
 
 def sign_hash(hash_value: bytes, priv_key: key.PrivateKey, hash_method: str) -> bytes:
     """Signs a precomputed hash with the private key.
@@ -222,11 +264,10 @@ def sign_hash(hash_value: bytes, priv_key: key.PrivateKey, hash_method: str) ->
     # Encrypt the hash with the private key
     cleartext = asn1code + hash_value
     keylength = common.byte_size(priv_key.n)
-    padded = _pad_for_signing(cleartext, keylength)
+    payload = _pad_for_signing_int(cleartext, keylength)
 
-    payload = transform.bytes2int(padded)
     encrypted = priv_key.blinded_encrypt(payload)
-    block = transform.int2bytes(encrypted, keylength)
+    block = encrypted.to_bytes(keylength, 'big')
 
     return block
 
@@ -265,9 +306,9 @@ def verify(message: bytes, signature: bytes, pub_key: key.PublicKey) -> str:
 
     """
     blocksize = common.byte_size(pub_key.n)
-    encrypted = transform.bytes2int(signature)
+    encrypted = int.from_bytes(signature, 'big')
     decrypted = core.decrypt_int(encrypted, pub_key.e, pub_key.n)
-    clearsig = transform.int2bytes(decrypted, blocksize)
+    clearsig = decrypted.to_bytes(blocksize, 'big')
 
     # Get the hash method
     method_name = _find_method_hash(clearsig)
@@ -277,8 +318,9 @@ def verify(message: bytes, signature: bytes, pub_key: key.PublicKey) -> str:
     cleartext = HASH_ASN1[method_name] + message_hash
     expected = _pad_for_signing(cleartext, blocksize)
 
-    # Compare with the signed one
-    if expected != clearsig:
+    # Compare with the signed one. Leading zeroes in the signature don't
+    # change its value, so its length has to be checked as well.
+    if len(signature) != len(expected) or not compare_digest(expected, clearsig):
         raise VerificationError('Verification failed')
 
     return method_name
@@ -294,9 +336,9 @@ def find_signature_hash(signature: bytes, pub_key: key.PublicKey) -> str:
     :returns: the name of the used hash.
     """
     blocksize = common.byte_size(pub_key.n)
-    encrypted = transform.bytes2int(signature)
+    encrypted = int.from_bytes(signature, 'big')
     decrypted = core.decrypt_int(encrypted, pub_key.e, pub_key.n)
-    clearsig = transform.int2bytes(decrypted, blocksize)
+    clearsig = decrypted.to_bytes(blocksize, 'big')
 
     return _find_method_hash(clearsig)
 
@@ -332,7 +374,7 @@ def compute_hash(message: typing.Union[bytes, typing.BinaryIO], method_name: str
     if isinstance(message, bytes):
         hasher.update(message)
     else:
-        for block in yield_fixedblocks(message, 1024):
+        for block in yield_fixedblocks(message, 64 * 1024):
             hasher.update(block)
 
     return hasher.digest()
@@ -344,9 +386,13 @@ def _find_method_hash(clearsig: bytes) -> str:
     :return: the used hash method.
     :raise VerificationFailed: when the hash method cannot be found
     """
-    for (hashname, asn1code) in HASH_ASN1.items():
-        if clearsig.startswith(asn1code):
-            return hashname
+    # The ASN1 code starts right after the 00 byte that ends the padding.
+    asn1_start = clearsig.find(b'\x00', 2) + 1
+    if asn1_start:
+        for length in _ASN1_CODE_LENGTHS:
+            hashname = _ASN1_HASH_NAMES.get(clearsig[asn1_start:asn1_start + length])
+            if hashname is not None:
+                return hashname
 
     raise VerificationError('Verification failed')
 __all__ = ['encrypt', 'decrypt', 'sign', 'verify', 'DecryptionError', 'VerificationError', 'CryptoError']
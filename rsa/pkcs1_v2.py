@@ -5,6 +5,9 @@ documentation is RFC 2437: https://tools.ietf.org/html/rfc2437
 """
 from rsa import common, pkcs1, transform
 
+# Output length of each hash method, to avoid creating a hasher just for that.
+_DIGEST_SIZES = {name: method().digest_size for (name, method) in pkcs1.HASH_METHODS.items()}
+
 def mgf1(seed: bytes, length: int, hasher: str='SHA-1') -> bytes:
     """
     MGF1 is a Mask Generation Function based on a hash function.
@@ -26,23 +29,26 @@ def mgf1(seed: bytes, length: int, hasher: str='SHA-1') -> bytes:
     :raise OverflowError: when `length` is too large for the specified `hasher`
     :raise ValueError: when specified `hasher` is invalid
     """
-    if hasher not in HASH_METHODS:
+    if hasher not in pkcs1.HASH_METHODS:
         raise ValueError(f'Invalid hash method: {hasher}')
-    
-    hash_method = HASH_METHODS[hasher]
-    h_len = hash_method().digest_size
-    
+
+    hash_method = pkcs1.HASH_METHODS[hasher]
+    h_len = _DIGEST_SIZES.get(hasher) or hash_method().digest_size
+
     if length > (2**32) * h_len:
         raise OverflowError(f'Desired length too long for {hasher}')
     
-    t = b''
-    counter = 0
-    while len(t) < length:
-        c = counter.to_bytes(4, byteorder='big')
-        t += hash_method(seed + c).digest()
-        counter += 1
-    
-    return t[:length]
+    # The seed is hashed only once; each block continues from a copy of that
+    # state with its own counter.
+    seed_hasher = hash_method()
+    seed_hasher.update(seed)
+    blocks = []
+    for counter in range(common.ceil_div(length, h_len)):
+        block_hasher = seed_hasher.copy()
+        block_hasher.update(counter.to_bytes(4, byteorder='big'))
+        blocks.append(block_hasher.digest())
+
+    return b''.join(blocks)[:length]
 __all__ = ['mgf1']
 if __name__ == '__main__':
     print('Running doctests 1000x or until failure')
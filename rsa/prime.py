@@ -3,19 +3,76 @@
 Implementation based on the book Algorithm Design by Michael T. Goodrich and
 Roberto Tamassia, 2002.
 """
+import math
+import typing
 import rsa.common
+import rsa.core
 import rsa.randnum
 __all__ = ['getprime', 'are_relatively_prime']
 
+def _odd_primes_below(limit: int) -> typing.Tuple[int, ...]:
+    """Returns the odd primes below 'limit', using the sieve of Eratosthenes."""
+    composite = bytearray(limit)
+    for p in range(3, int(limit ** 0.5) + 1, 2):
+        if not composite[p]:
+            composite[p * p::2 * p] = b'\x01' * len(range(p * p, limit, 2 * p))
+    return tuple(p for p in range(3, limit, 2) if not composite[p])
+
+# Odd primes below 10000. getprime() sieves its candidates with them, and
+# is_prime() uses their product to weed out most composites with a single
+# gcd before running Miller-Rabin; one gcd with this ~14000-bit product is
+# much cheaper than 1228 modulo operations.
+_SMALL_PRIMES = _odd_primes_below(10000)
+_SMALL_PRIMES_SET = frozenset(_SMALL_PRIMES)
+_SMALL_PRIMES_PRODUCT = 1
+for _p in _SMALL_PRIMES:
+    _SMALL_PRIMES_PRODUCT *= _p
+del _p
+
+# 10007 is the smallest prime larger than those in _SMALL_PRIMES.
+_SMALL_PRIMES_BOUND_SQUARED = 10007 * 10007
+
+# Miller-Rabin witnesses that give an exact answer for all odd numbers below
+# the threshold. Thresholds below _SMALL_PRIMES_BOUND_SQUARED are not needed.
+# See https://oeis.org/A014233 and Sorenson & Webster, "Strong pseudoprimes
+# to twelve prime bases", Math. Comp. 86 (2017).
+_DETERMINISTIC_WITNESSES = (
+    (3215031751, (2, 3, 5, 7)),
+    (4759123141, (2, 7, 61)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+# Number of consecutive odd numbers that getprime() sieves at once. Primes of
+# 1024 bits are on average 710 apart, so this is nearly always enough.
+_SIEVE_SIZE = 4096
+
 def gcd(p: int, q: int) -> int:
     """Returns the greatest common divisor of p and q
 
     >>> gcd(48, 180)
     12
     """
-    while q:
-        p, q = q, p % q
-    return p
+    return math.gcd(p, q)
+
+def _has_small_factor(number: int) -> bool:
+    """Returns True if the number is divisible by one of _SMALL_PRIMES.
+
+    This includes the small primes themselves; is_prime() checks for those
+    first.
+
+    >>> _has_small_factor(3 * 10007)
+    True
+    >>> _has_small_factor(10007 * 10009)
+    False
+    >>> _has_small_factor(9973)
+    True
+    """
+    return math.gcd(number, _SMALL_PRIMES_PRODUCT) != 1
 
 def get_primality_testing_rounds(number: int) -> int:
     """Returns minimum number of rounds for Miller-Rabin primality testing,
@@ -60,18 +117,27 @@ def miller_rabin_primality_testing(n: int, k: int) -> bool:
     if n < 2 or n % 2 == 0:
         return False
 
+    # Generate random integers a, where 2 <= a <= (n - 2)
+    witnesses = (rsa.randnum.randint(n - 3) + 1 for _ in range(k))
+    return _miller_rabin(n, witnesses)
+
+def _miller_rabin(n: int, witnesses: typing.Iterable[int]) -> bool:
+    """Applies Miller-Rabin primality testing to the odd number n > 3.
+
+    :return: False if one of the witnesses shows that n is composite, True
+        otherwise.
+    """
     r, s = 0, n - 1
     while s % 2 == 0:
         r += 1
         s //= 2
 
-    for _ in range(k):
-        a = rsa.randnum.randint(2, n - 1)
-        x = pow(a, s, n)
+    for a in witnesses:
+        x = rsa.core.powmod(a, s, n)
         if x == 1 or x == n - 1:
             continue
         for _ in range(r - 1):
-            x = pow(x, 2, n)
+            x = rsa.core.powmod(x, 2, n)
             if x == n - 1:
                 break
         else:
@@ -94,12 +160,55 @@ def is_prime(number: int) -> bool:
         return True
     if number % 2 == 0:
         return False
+    if number in _SMALL_PRIMES_SET:
+        return True
+    if _has_small_factor(number):
+        return False
+
+    # Without a factor in _SMALL_PRIMES, a number below the square of the next
+    # prime has no factor at all.
+    if number < _SMALL_PRIMES_BOUND_SQUARED:
+        return True
+
+    # Below the thresholds of the table, Miller-Rabin with a fixed set of
+    # witnesses is exact, and no random numbers are needed.
+    for threshold, witnesses in _DETERMINISTIC_WITNESSES:
+        if number < threshold:
+            return _miller_rabin(number, witnesses)
 
     return miller_rabin_primality_testing(number, get_primality_testing_rounds(number))
 
-def getprime(nbits: int) -> int:
+def _sieve(start: int, count: int) -> typing.Iterator[int]:
+    """Generator over the numbers start + 2i, for 0 <= i < count, that have no
+    factor in _SMALL_PRIMES.
+
+    'start' must be odd and larger than the largest of _SMALL_PRIMES. The
+    multiples of each small prime are crossed off with a single slice
+    assignment, so no division is needed per candidate.
+    """
+    composite = bytearray(count)
+    for p in _SMALL_PRIMES:
+        # First i for which start + 2i is divisible by p; (p + 1) // 2 is the
+        # inverse of 2 modulo p.
+        first = (-start % p) * ((p + 1) // 2) % p
+        composite[first::p] = b'\x01' * len(range(first, count, p))
+
+    for i in range(count):
+        if not composite[i]:
+            yield start + 2 * i
+
+def getprime(nbits: int, top_bits: typing.Optional[int] = None) -> int:
     """Returns a prime number that can be stored in 'nbits' bits.
 
+    The search starts at a random odd number with the top bit set, and walks
+    up from there through the candidates that survive a sieve of small primes.
+
+    :param nbits: the number of bits of the prime.
+    :param top_bits: bits that are set in every candidate, such as
+        ``0b11 << (nbits - 2)`` to get a prime with the top two bits set.
+        Must include the top bit of an 'nbits'-bit number. Defaults to
+        just that top bit.
+
     >>> p = getprime(128)
     >>> is_prime(p-1)
     False
@@ -111,15 +220,36 @@ def getprime(nbits: int) -> int:
     >>> from rsa import common
     >>> common.bit_size(p) == 128
     True
+
+    >>> p = getprime(128, top_bits=0b11 << 126)
+    >>> p >> 126
+    3
     """
+    if top_bits is None:
+        top_bits = 1 << (nbits - 1)
+    elif top_bits >> (nbits - 1) != 1:
+        raise ValueError('top_bits must include the top bit of a %i-bit number, '
+                         'and no higher bits' % nbits)
+
+    if top_bits <= _SMALL_PRIMES[-1]:
+        # Too small for the sieve, as it would cross off the small primes
+        # themselves. Just try random numbers.
+        while True:
+            integer = rsa.randnum.read_random_odd_int(nbits) | top_bits
+            if is_prime(integer):
+                return integer
+
+    limit = 1 << nbits
     while True:
-        integer = rsa.randnum.read_random_odd_int(nbits)
+        start = rsa.randnum.read_random_odd_int(nbits) | top_bits
+        rounds = get_primality_testing_rounds(start)
+        count = min(_SIEVE_SIZE, (limit - start + 1) // 2)
 
-        # Test for primality
-        if is_prime(integer):
-            return integer
+        for integer in _sieve(start, count):
+            if miller_rabin_primality_testing(integer, rounds):
+                return integer
 
-        # If not prime, generate another random integer
+        # No prime in this range, start over from another random number.
 
 def are_relatively_prime(a: int, b: int) -> bool:
     """Returns True if a and b are relatively prime, and False if they
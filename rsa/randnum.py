@@ -1,28 +1,35 @@
 """Functions for generating random numbers."""
 import os
-from rsa import common, transform
+import secrets
 
 def read_random_bits(nbits: int) -> bytes:
     """Reads 'nbits' random bits.
 
-    If nbits isn't a whole number of bytes, an extra byte will be appended with
+    If nbits isn't a whole number of bytes, an extra byte will be prepended with
     only the lower bits set.
     """
     nbytes, rbits = divmod(nbits, 8)
 
-    # Get the whole bytes
-    bytes_data = os.urandom(nbytes)
+    if rbits == 0:
+        return os.urandom(nbytes)
 
-    # If there are remaining bits, add one more byte
-    if rbits > 0:
-        last_byte = os.urandom(1)[0] & ((1 << rbits) - 1)
-        bytes_data += bytes([last_byte])
-
-    return bytes_data
+    # There are remaining bits, so read one more byte and keep only the lower
+    # bits of the first one. It goes in front so that the result never has
+    # more than nbits bits when read as big-endian.
+    bytes_data = bytearray(os.urandom(nbytes + 1))
+    bytes_data[0] &= (1 << rbits) - 1
+    return bytes(bytes_data)
 
 def read_random_int(nbits: int) -> int:
-    """Reads a random integer of approximately nbits bits."""
-    return transform.bytes2int(read_random_bits(nbits))
+    """Reads a random integer of approximately nbits bits.
+
+    >>> read_random_int(12) < 4096
+    True
+    """
+    # Read whole bytes and shift off the surplus bits, instead of masking
+    # them in a separate bytes object first.
+    nbytes = (nbits + 7) >> 3
+    return int.from_bytes(os.urandom(nbytes), 'big') >> (nbytes * 8 - nbits)
 
 def read_random_odd_int(nbits: int) -> int:
     """Reads a random odd integer of approximately nbits bits.
@@ -35,13 +42,7 @@ def read_random_odd_int(nbits: int) -> int:
 def randint(maxvalue: int) -> int:
     """Returns a random integer x with 1 <= x <= maxvalue
 
-    May take a very long time in specific situations. If maxvalue needs N bits
-    to store, the closer maxvalue is to (2 ** N) - 1, the faster this function
-    is.
+    Uses :py:func:`secrets.randbelow`, which draws only as many random bits
+    as maxvalue needs and rejects fewer than half of the draws.
     """
-    bit_size = common.bit_size(maxvalue)
-    
-    while True:
-        value = read_random_int(bit_size)
-        if 1 <= value <= maxvalue:
-            return value
+    return secrets.randbelow(maxvalue) + 1
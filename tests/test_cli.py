@@ -130,7 +130,7 @@ class KeygenTest(AbstractCliTest):
         # The key size should be shown on stderr
         self.assertTrue("128-bit key" in err.getvalue())
 
-    @cleanup_files("test_cli_privkey_out.pem")
+    @cleanup_files("test_cli_privkey_out.pem", "test_cli_privkey_out_pub.pem")
     def test_keygen_priv_out_pem(self):
         with captured_output() as (out, err):
             with cli_args("--out=test_cli_privkey_out.pem", "--form=PEM", 128):
@@ -146,7 +146,12 @@ class KeygenTest(AbstractCliTest):
         with open("test_cli_privkey_out.pem", "rb") as pemfile:
             rsa.PrivateKey.load_pkcs1(pemfile.read())
 
-    @cleanup_files("test_cli_privkey_out.der")
+        # The public key is saved next to the private key by default.
+        self.assertTrue("test_cli_privkey_out_pub.pem" in err.getvalue())
+        with open("test_cli_privkey_out_pub.pem", "rb") as pemfile:
+            rsa.PublicKey.load_pkcs1(pemfile.read())
+
+    @cleanup_files("test_cli_privkey_out.der", "test_cli_privkey_out_pub.pem")
     def test_keygen_priv_out_der(self):
         with captured_output() as (out, err):
             with cli_args("--out=test_cli_privkey_out.der", "--form=DER", 128):
@@ -15,7 +15,7 @@
 
 import unittest
 import struct
-from rsa.common import byte_size, bit_size, inverse
+from rsa.common import byte_size, bit_size, ceil_div, crt, extended_gcd, inverse
 
 
 class TestByteSize(unittest.TestCase):
@@ -81,3 +81,41 @@ class TestInverse(unittest.TestCase):
     def test_not_relprime(self):
         self.assertRaises(ValueError, inverse, 4, 8)
         self.assertRaises(ValueError, inverse, 25, 5)
+
+
+class TestExtendedGcd(unittest.TestCase):
+    def test_small(self):
+        self.assertEqual((2, -9, 47), extended_gcd(240, 46))
+        self.assertEqual((5, 0, 1), extended_gcd(0, 5))
+
+    def test_large(self):
+        # Large enough to take the Lehmer steps.
+        a = (1 << 2203) - 1
+        b = (1 << 2281) - 1
+        (r, i, j) = extended_gcd(a, b)
+        self.assertEqual(1, r)
+        self.assertEqual(1, i * a + j * b)
+
+
+class TestCrt(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(8, crt([2, 3], [3, 5]))
+        self.assertEqual(23, crt([2, 3, 2], [3, 5, 7]))
+        self.assertEqual(135, crt([2, 3, 0], [7, 11, 15]))
+
+    def test_not_relprime(self):
+        self.assertRaises(ValueError, crt, [1, 2], [6, 9])
+
+
+class TestCeilDiv(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(15, ceil_div(100, 7))
+        self.assertEqual(13, ceil_div(100, 8))
+        self.assertEqual(12, ceil_div(96, 8))
+        self.assertEqual(-12, ceil_div(-100, 8))
+
+    def test_bits_to_bytes(self):
+        self.assertEqual(128, ceil_div(1023, 8))
+        self.assertEqual(129, ceil_div(1025, 8))
+        self.assertEqual(0, ceil_div(0, 8))
+        self.assertEqual(1, ceil_div(1, 1))
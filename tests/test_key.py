@@ -36,6 +36,16 @@ class BlindingTest(unittest.TestCase):
         unblinded_2 = pk.unblind(decrypted, unblind_2)
         self.assertEqual(unblinded_2, message)
 
+    def test_blinded_decrypt_encrypt(self):
+        """The exponent blinding should not change the results."""
+
+        pk = rsa.key.PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+
+        for message in (1, 2, 12345, 65063, 57287, pk.n - 1):
+            encrypted = rsa.core.encrypt_int(message, pk.e, pk.n)
+            self.assertEqual(message, pk.blinded_decrypt(encrypted))
+            self.assertEqual(rsa.core.decrypt_int(message, pk.d, pk.n), pk.blinded_encrypt(message))
+
 
 class KeyGenTest(unittest.TestCase):
     def test_custom_exponent(self):
@@ -1,5 +1,9 @@
 """Test for multiprocess prime generation."""
 
+import multiprocessing as mp
+import os
+import subprocess
+import sys
 import unittest
 
 import rsa.prime
@@ -18,3 +22,77 @@ class ParallelTest(unittest.TestCase):
         self.assertFalse(rsa.prime.is_prime(p + 1))
 
         self.assertEqual(1024, rsa.common.bit_size(p))
+
+    def test_workers_stopped(self):
+        """No worker process should outlive the call."""
+
+        rsa.parallel.getprime(256, 3)
+        self.assertEqual([], mp.active_children())
+
+    def test_exits_promptly(self):
+        """The worker processes should not keep the interpreter alive."""
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.abspath(rsa.__file__)))
+        code = "import rsa.parallel; rsa.parallel.getprime(256, 3)"
+
+        # Raises subprocess.TimeoutExpired when the interpreter hangs.
+        subprocess.run([sys.executable, "-c", code], env=env, timeout=30, check=True)
+
+    def test_poolsize_changes(self):
+        for poolsize in (1, 4, 2):
+            p = rsa.parallel.getprime(128, poolsize)
+            self.assertTrue(rsa.prime.is_prime(p))
+            self.assertEqual(128, rsa.common.bit_size(p))
+
+
+class SparePrimesTest(unittest.TestCase):
+    """Tests for the primes kept from other workers."""
+
+    def setUp(self):
+        rsa.parallel._spare_primes.clear()
+
+    def tearDown(self):
+        rsa.parallel._spare_primes.clear()
+
+    def test_spare_primes_handed_out(self):
+        spare = rsa.prime.getprime(64)
+        rsa.parallel._spare_primes[64].append(spare)
+
+        # The spare prime is returned without starting any worker, and only once.
+        self.assertEqual(spare, rsa.parallel.getprime(64, 2))
+        self.assertEqual(0, len(rsa.parallel._spare_primes[64]))
+        self.assertEqual(0, len(rsa.parallel._spare_primes[128]))
+
+    def test_spare_primes_collected(self):
+        # Small primes are found so quickly that the other workers nearly
+        # always have some waiting by the time the first one is received.
+        first = rsa.parallel.getprime(24, 4)
+        spares = list(rsa.parallel._spare_primes[24])
+
+        self.assertLessEqual(len(spares), rsa.parallel._MAX_SPARE_PRIMES)
+        for p in [first] + spares:
+            self.assertTrue(rsa.prime.is_prime(p))
+            self.assertEqual(0b11, p >> 22)
+
+        for spare in spares:
+            self.assertEqual(spare, rsa.parallel.getprime(24, 4))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork()")
+    def test_spare_primes_reset_after_fork(self):
+        spare = rsa.prime.getprime(64)
+        rsa.parallel._spare_primes[64].append(spare)
+
+        pid = os.fork()
+        if pid == 0:
+            # Child: must not hand out the parent's spare prime.
+            ok = False
+            try:
+                ok = rsa.parallel.getprime(64, 1) != spare
+                ok = ok and spare not in rsa.parallel._spare_primes[64]
+            finally:
+                os._exit(0 if ok else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, status)
+        self.assertEqual([spare], list(rsa.parallel._spare_primes[64]))
@@ -15,7 +15,7 @@
 
 import unittest
 
-from rsa.pem import _markers
+from rsa.pem import _markers, load_pem
 import rsa.key
 
 # 512-bit key. Too small for practical purposes, but good enough for testing with.
@@ -98,3 +98,25 @@ class TestByteInput(unittest.TestCase):
         key = rsa.key.PrivateKey.load_pkcs1(private_key_pem.encode("ascii"))
         self.assertIsInstance(key.save_pkcs1(format="DER"), bytes)
         self.assertIsInstance(key.save_pkcs1(format="PEM"), bytes)
+
+
+class TestLoadPem(unittest.TestCase):
+    """Tests the extraction of the PEM body."""
+
+    def test_missing_start_marker(self):
+        with self.assertRaisesRegex(ValueError, "start marker"):
+            load_pem(b"MAwCBQDeKYlRAgMBAAE=", "RSA PUBLIC KEY")
+
+    def test_start_marker_not_on_own_line(self):
+        pem = b"prefix-----BEGIN X-----\nAAEC\n-----END X-----\n"
+        with self.assertRaisesRegex(ValueError, "start marker"):
+            load_pem(pem, "X")
+
+    def test_missing_end_marker(self):
+        pem = b"-----BEGIN RSA PUBLIC KEY-----\nMAwCBQDeKYlRAgMBAAE=\n"
+        with self.assertRaisesRegex(ValueError, "end marker"):
+            load_pem(pem, "RSA PUBLIC KEY")
+
+    def test_crlf_line_endings(self):
+        pem = b"-----BEGIN RSA PUBLIC KEY-----\r\nMAwCBQDeKYlRAgMBAAE=\r\n-----END RSA PUBLIC KEY-----\r\n"
+        self.assertEqual(b"0\x0c\x02\x05\x00\xde)\x89Q\x02\x03\x01\x00\x01", load_pem(pem, "RSA PUBLIC KEY"))
@@ -19,6 +19,10 @@ import sys
 import unittest
 
 import rsa
+import rsa.common
+import rsa.core
+import rsa.prime
+import rsa.transform
 from rsa import pkcs1
 
 
@@ -90,6 +94,20 @@ class ExtraZeroesTest(unittest.TestCase):
             rsa.decrypt(cyphertext, self.private_key)
 
 
+class PadForSigningTest(unittest.TestCase):
+    def test_int_matches_bytes(self):
+        for target_length in (16, 64, 512):
+            for message in (b"", b"hello", b"\x00\xff" * 2, b"\x01" * (target_length - 11)):
+                padded = pkcs1._pad_for_signing(message, target_length)
+                self.assertEqual(
+                    int.from_bytes(padded, "big"),
+                    pkcs1._pad_for_signing_int(message, target_length),
+                )
+
+    def test_int_too_long(self):
+        self.assertRaises(OverflowError, pkcs1._pad_for_signing_int, b"\x01" * 6, 16)
+
+
 class SignatureTest(unittest.TestCase):
     def setUp(self):
         (self.pub, self.priv) = rsa.newkeys(512)
@@ -183,6 +201,24 @@ class SignatureTest(unittest.TestCase):
             pkcs1.verify(message, signature, self.pub)
 
 
+class FixedKeySignatureTest(unittest.TestCase):
+    """Sign and verify with a key built from two primes, without newkeys()."""
+
+    def setUp(self):
+        p, q = rsa.prime.getprime(256), rsa.prime.getprime(256)
+        d = rsa.common.inverse(65537, (p - 1) * (q - 1))
+        self.pub = rsa.PublicKey(p * q, 65537)
+        self.priv = rsa.PrivateKey(p * q, 65537, d, p, q)
+
+    def test_sign_verify(self):
+        signature = pkcs1.sign(b"je moeder", self.priv, "SHA-256")
+        self.assertEqual("SHA-256", pkcs1.verify(b"je moeder", signature, self.pub))
+
+    def test_prepend_zeroes(self):
+        signature = b"\x00\x00" + pkcs1.sign(b"je moeder", self.priv, "SHA-256")
+        self.assertRaises(pkcs1.VerificationError, pkcs1.verify, b"je moeder", signature, self.pub)
+
+
 class PaddingSizeTest(unittest.TestCase):
     def test_too_little_padding(self):
         """Padding less than 8 bytes should be rejected."""
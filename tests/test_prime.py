@@ -83,6 +83,27 @@ class PrimeTest(unittest.TestCase):
         finally:
             rsa.randnum.randint = orig_randint
 
+    def test_is_prime_deterministic(self):
+        """Numbers below 3317044064679887385961981 need no random witnesses."""
+
+        def fake_randint(maxvalue):
+            raise AssertionError("randint() should not be called")
+
+        orig_randint = rsa.randnum.randint
+        rsa.randnum.randint = fake_randint
+        try:
+            self.assertTrue(rsa.prime.is_prime(10007 * 10007 - 6))
+            self.assertFalse(rsa.prime.is_prime(10007 * 10007))
+            self.assertFalse(rsa.prime.is_prime(10007 * 10009))
+            self.assertTrue(rsa.prime.is_prime(2 ** 61 - 1))
+            self.assertFalse(rsa.prime.is_prime(982451653 * 961748941))
+
+            # Strong pseudoprimes to the witnesses of the previous threshold.
+            self.assertFalse(rsa.prime.is_prime(3825123056546413051))
+            self.assertFalse(rsa.prime.is_prime(318665857834031151167461))
+        finally:
+            rsa.randnum.randint = orig_randint
+
     def test_mersenne_primes(self):
         """Tests first known Mersenne primes.
 
@@ -131,3 +152,24 @@ class PrimeTest(unittest.TestCase):
         self.assertEqual(rsa.prime.get_primality_testing_rounds(1 << 1535), 3)
         self.assertEqual(rsa.prime.get_primality_testing_rounds(1 << 2047), 3)
         self.assertEqual(rsa.prime.get_primality_testing_rounds(1 << 4095), 3)
+
+    def test_getprime_top_bits(self):
+        for nbits in (8, 64, 256):
+            p = rsa.prime.getprime(nbits, top_bits=0b11 << (nbits - 2))
+            self.assertTrue(rsa.prime.is_prime(p))
+            self.assertEqual(0b11, p >> (nbits - 2))
+
+        self.assertRaises(ValueError, rsa.prime.getprime, 64, 1 << 62)
+        self.assertRaises(ValueError, rsa.prime.getprime, 64, 1 << 64)
+
+    def test_has_small_factor(self):
+        """Test the trial division against small primes."""
+
+        self.assertFalse(rsa.prime._has_small_factor(2))
+        self.assertTrue(rsa.prime._has_small_factor(1999))
+        self.assertTrue(rsa.prime._has_small_factor(9))
+        self.assertTrue(rsa.prime._has_small_factor(1999 * 982451653))
+        self.assertFalse(rsa.prime._has_small_factor(982451653))
+        self.assertTrue(rsa.prime._has_small_factor(9973 * 982451653))
+        self.assertTrue(rsa.prime._has_small_factor(9973))
+        self.assertFalse(rsa.prime._has_small_factor(10007 * 982451653))